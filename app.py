@@ -21,13 +21,17 @@ from services.recommendation_service import RecommendationService
 from services.location_service import LocationService
 from services.message_service import MessageService
 from services.rating_service import RatingService
+from datastore import StripedStore
+from autocomplete import AutocompleteIndex
+from rendering import init_rendering, render_list
 
-# In-memory data stores
-users = {}  # userId -> user object
-jobs = {}   # jobId -> job object
-skills = {}  # skillId -> skill object
-messages = {}  # messageId -> message object
-ratings = {}  # ratingId -> rating object
+# In-memory data stores (lock-striped so the app can run with threaded workers)
+users = StripedStore()  # userId -> user object
+jobs = StripedStore()   # jobId -> job object
+skills = StripedStore()  # skillId -> skill object
+messages = StripedStore()  # messageId -> message object
+ratings = StripedStore()  # ratingId -> rating object
+rating_claims = StripedStore()  # (raterId, ratedUserId, jobId) -> True, one rating per triple
 
 # Add default Indian jobs and skills
 def add_sample_data():
@@ -247,6 +251,13 @@ rating_service = RatingService(users, ratings, jobs)
 # Add sample data
 add_sample_data()
 
+# Precompile templates and enable response compression
+init_rendering(app)
+
+# Build autocomplete tries from the catalog and sample data
+autocomplete_index = AutocompleteIndex(skills)
+autocomplete_index.build(users, jobs)
+
 # Routes
 @app.route('/')
 def index():
@@ -392,7 +403,12 @@ def profile():
     
     user_id = session['user_id']
     user = auth_service.get_user_by_id(user_id)
-    
+
+    if not user:
+        session.clear()
+        flash('User not found', 'danger')
+        return redirect(url_for('login'))
+
     if request.method == 'POST':
         # Update user profile
         updated_user = {
@@ -404,7 +420,15 @@ def profile():
             'availability': request.form.get('availability')
         }
         
-        auth_service.update_user(user_id, updated_user)
+        # The service edits a private copy published under the user's lock, never the shared object.
+        # Capture the pre-edit state under the same lock so concurrent saves each un-index their own old values
+        with users.edit(user_id) as draft:
+            old_user = dict(draft)
+            auth_service.update_user(user_id, updated_user)
+        
+        # Move the user's old location/skills out of the autocomplete tries and the new ones in
+        autocomplete_index.index_user(old_user, delta=-1)
+        autocomplete_index.index_user(auth_service.get_user_by_id(user_id))
         flash('Profile updated successfully', 'success')
         return redirect(url_for('profile'))
     
@@ -432,6 +456,7 @@ def post_job():
         }
         
         jobs[job['id']] = job
+        autocomplete_index.index_job(job)
         flash('Job posted successfully', 'success')
         return redirect(url_for('dashboard'))
     
@@ -447,7 +472,7 @@ def search_jobs():
     location = request.args.get('location', '')
     
     filtered_jobs = []
-    for job in jobs.values():
+    for job in jobs.snapshot().values():
         if job['status'] == 'open':
             if (search_term.lower() in job['title'].lower() or 
                 search_term.lower() in job['description'].lower()):
@@ -458,7 +483,7 @@ def search_jobs():
         # Use location service to sort by proximity
         filtered_jobs = location_service.sort_by_proximity(filtered_jobs, location)
     
-    return render_template('job_search.html', jobs=filtered_jobs, search_term=search_term, location=location)
+    return render_list('job_search.html', len(filtered_jobs), jobs=filtered_jobs, search_term=search_term, location=location)
 
 @app.route('/job/<job_id>')
 def view_job(job_id):
@@ -488,19 +513,17 @@ def apply_job(job_id):
     
     user_id = session['user_id']
     
-    # Check if already applied
-    for application in job['applications']:
-        if application['worker_id'] == user_id:
-            flash('You have already applied for this job', 'warning')
-            return redirect(url_for('view_job', job_id=job_id))
-    
     application = {
         'worker_id': user_id,
         'status': 'pending',
         'applied_at': datetime.datetime.now().isoformat()
     }
     
-    job['applications'].append(application)
+    # Check-and-append atomically so concurrent requests can't double-apply
+    if not jobs.append_unique(job_id, 'applications', application, unique_by='worker_id'):
+        flash('You have already applied for this job', 'warning')
+        return redirect(url_for('view_job', job_id=job_id))
+    
     flash('Application submitted successfully', 'success')
     return redirect(url_for('dashboard'))
 
@@ -529,7 +552,7 @@ def view_applications(job_id):
                 'applied_at': application['applied_at']
             })
     
-    return render_template('applications.html', job=job, applications=applications)
+    return render_list('applications.html', len(applications), job=job, applications=applications)
 
 @app.route('/messages')
 def messages_view():
@@ -556,7 +579,7 @@ def messages_view():
     for conv in conversations.values():
         conv['messages'].sort(key=lambda x: x['timestamp'])
     
-    return render_template('messages.html', conversations=conversations)
+    return render_list('messages.html', len(user_messages), conversations=conversations)
 
 @app.route('/messages/send', methods=['POST'])
 def send_message():
@@ -589,7 +612,17 @@ def rate_user(user_id):
     job_id = request.form.get('job_id')
     comment = request.form.get('comment', '')
     
-    rating_service.add_rating(rater_id, user_id, rating_value, comment, job_id)
+    # Claim the rater/rated/job triple atomically before the service stores the rating
+    rating_key = (rater_id, user_id, job_id)
+    if not rating_claims.insert_unique(rating_key, True):
+        flash('You have already rated this user', 'warning')
+        return redirect(url_for('view_profile', user_id=user_id))
+    
+    try:
+        rating_service.add_rating(rater_id, user_id, rating_value, comment, job_id)
+    except Exception:
+        del rating_claims[rating_key]
+        raise
     flash('Rating submitted successfully', 'success')
     return redirect(url_for('view_profile', user_id=user_id))
 
@@ -642,5 +675,25 @@ def search_workers_api():
     
     return jsonify({'workers': safe_workers})
 
+@app.route('/api/autocomplete')
+def autocomplete_api():
+    if 'user_id' not in session:
+        return jsonify({'error': 'Authentication required'}), 401
+    
+    field = request.args.get('field', 'titles')
+    prefix = request.args.get('q', '')
+    fuzzy = request.args.get('fuzzy', '1') != '0'
+    
+    if field not in AutocompleteIndex.FIELDS:
+        return jsonify({'error': 'Unknown field'}), 400
+    
+    try:
+        limit = int(request.args.get('limit', 10))
+    except ValueError:
+        return jsonify({'error': 'Invalid limit'}), 400
+    
+    suggestions = autocomplete_index.suggest(field, prefix, max(limit, 1), fuzzy)
+    return jsonify({'field': field, 'query': prefix, 'suggestions': suggestions})
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
@@ -0,0 +1,179 @@
+# In-memory prefix tries for autocomplete on skills, locations and job titles
+# Every node keeps its popularity-weighted top-k terms so a lookup is just a walk down the prefix
+
+import threading
+from collections import defaultdict
+
+TOP_K = 10
+FUZZY_THRESHOLD = 0.3
+
+
+def normalize(text):
+    """Lowercase and collapse whitespace so 'Mumbai ,  MH' and 'mumbai , mh' index the same"""
+    return ' '.join((text or '').lower().split())
+
+
+def _trigrams(key):
+    padded = '  ' + key + ' '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _Node:
+    __slots__ = ('children', 'term', 'top')
+
+    def __init__(self):
+        self.children = {}
+        self.term = None  # Normalized key if a term ends here
+        self.top = ()  # (key, display) pairs for the best terms in this subtree, highest weight first
+
+
+class PrefixTrie:
+    """Prefix trie with popularity-weighted top-k at each node and trigram fuzzy fallback.
+
+    Writers serialize on a lock. Prefix lookups are lock-free because each node's top-k
+    is republished as a new tuple of (key, display) pairs; the fuzzy pass takes the lock.
+    """
+    def __init__(self, top_k=TOP_K):
+        self.top_k = top_k
+        self._root = _Node()
+        self._weights = {}  # key -> popularity
+        self._display = {}  # key -> first-seen display form
+        self._trigram_index = defaultdict(set)  # trigram -> keys
+        self._lock = threading.Lock()
+
+    def _rank(self, keys):
+        ranked = sorted(keys, key=lambda k: (-self._weights[k], k))[:self.top_k]
+        return tuple((k, self._display[k]) for k in ranked)
+
+    def add(self, term, delta=1):
+        """Adjust the popularity of term by delta; terms dropping to zero are removed"""
+        key = normalize(term)
+        if not key:
+            return
+        with self._lock:
+            weight = self._weights.get(key, 0) + delta
+            if weight > 0:
+                if key not in self._weights:
+                    self._display[key] = ' '.join(term.split())
+                    for gram in _trigrams(key):
+                        self._trigram_index[gram].add(key)
+                self._weights[key] = weight
+            elif key in self._weights:
+                del self._weights[key]
+                del self._display[key]
+                for gram in _trigrams(key):
+                    bucket = self._trigram_index.get(gram)
+                    if bucket is not None:
+                        bucket.discard(key)
+                        if not bucket:
+                            del self._trigram_index[gram]
+            else:
+                return
+
+            path = [self._root]
+            for char in key:
+                node = path[-1].children.get(char)
+                if node is None:
+                    node = _Node()
+                    path[-1].children[char] = node
+                path.append(node)
+            path[-1].term = key if weight > 0 else None
+
+            # Drop the removed term's now-empty tail so churn doesn't grow the trie
+            while len(path) > 1 and not path[-1].children and path[-1].term is None:
+                path.pop()
+                del path[-1].children[key[len(path) - 1]]
+
+            # Recompute top-k bottom-up along the changed path only
+            for node in reversed(path):
+                candidates = set()
+                if node.term is not None:
+                    candidates.add(node.term)
+                for child in node.children.values():
+                    candidates.update(k for k, _ in child.top)
+                node.top = self._rank(candidates)
+
+    def remove(self, term, delta=1):
+        self.add(term, -delta)
+
+    def suggest(self, prefix, limit=TOP_K, fuzzy=True):
+        """Return up to limit display terms starting with prefix, or fuzzy matches if none do"""
+        key = normalize(prefix)
+        limit = min(limit, self.top_k)
+
+        node = self._root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                break
+        if node is not None and node.top:
+            return [display for _, display in node.top[:limit]]
+
+        if not fuzzy or len(key) < 3:
+            return []
+        return self._fuzzy(key, limit)
+
+    def _fuzzy(self, key, limit):
+        """Rank terms by trigram Jaccard similarity to key, then popularity"""
+        query = _trigrams(key)
+        with self._lock:
+            shared = defaultdict(int)
+            for gram in query:
+                for candidate in self._trigram_index.get(gram, ()):
+                    shared[candidate] += 1
+            scored = []
+            for candidate, count in shared.items():
+                score = count / (len(query) + len(_trigrams(candidate)) - count)
+                if score >= FUZZY_THRESHOLD:
+                    scored.append((-score, -self._weights[candidate], candidate))
+            scored.sort()
+            return [self._display[candidate] for _, _, candidate in scored[:limit]]
+
+
+def location_terms(location):
+    """Return the full location plus each comma-separated part, e.g. 'Thane, Maharashtra' -> 3 terms"""
+    if not location:
+        return []
+    parts = [part.strip() for part in location.split(',') if part.strip()]
+    terms = [', '.join(parts)]
+    if len(parts) > 1:
+        terms.extend(parts)
+    return terms
+
+
+class AutocompleteIndex:
+    """Skill, location and job title tries kept in sync with the data stores"""
+    FIELDS = ('skills', 'locations', 'titles')
+
+    def __init__(self, skills_catalog):
+        self.skills_catalog = skills_catalog  # skillId -> skill object
+        self.tries = {field: PrefixTrie() for field in self.FIELDS}
+
+    def _skill_name(self, skill):
+        catalog_entry = self.skills_catalog.get(skill)
+        return catalog_entry['name'] if catalog_entry else skill
+
+    def build(self, users, jobs):
+        for skill in self.skills_catalog.values():
+            self.tries['skills'].add(skill['name'])
+        for job in jobs.values():
+            self.index_job(job)
+        for user in users.values():
+            self.index_user(user)
+
+    def index_job(self, job, delta=1):
+        self.tries['titles'].add(job.get('title'), delta)
+        for term in location_terms(job.get('location')):
+            self.tries['locations'].add(term, delta)
+        for skill in job.get('skills_required', []):
+            self.tries['skills'].add(self._skill_name(skill), delta)
+
+    def index_user(self, user, delta=1):
+        for term in location_terms(user.get('location')):
+            self.tries['locations'].add(term, delta)
+        if user.get('user_type') == 'worker':
+            for skill in user.get('skills') or []:
+                self.tries['skills'].add(self._skill_name(skill), delta)
+
+    def suggest(self, field, prefix, limit=TOP_K, fuzzy=True):
+        return self.tries[field].suggest(prefix, limit, fuzzy)
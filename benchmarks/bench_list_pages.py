@@ -0,0 +1,118 @@
+"""Bytes on the wire and time to first byte for the large list pages.
+
+Fills the in-memory stores with --rows jobs, applications and messages, then requests
+/job/search, /job/<id>/applications and /messages through the Flask test client for
+each combination of buffered/streamed rendering and identity/gzip/br encoding.
+
+Usage: python benchmarks/bench_list_pages.py [--rows 1000] [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as workerconnect  # noqa: E402
+import rendering  # noqa: E402
+
+EMPLOYER_ID = 'e1'
+BENCH_JOB_ID = 'bench-job'
+
+
+def populate(rows):
+    for i in range(rows):
+        worker_id = f'bench-w{i}'
+        workerconnect.users[worker_id] = {
+            'id': worker_id,
+            'name': f'Bench Worker {i}',
+            'email': f'bench{i}@example.com',
+            'password': '',
+            'user_type': 'worker',
+            'location': 'Pune, Maharashtra',
+            'skills': ['Carpentry', 'Masonry'],
+            'bio': 'Experienced site worker available for daily wage contracts.',
+        }
+        workerconnect.jobs[f'bench-j{i}'] = {
+            'id': f'bench-j{i}',
+            'title': f'Site Worker Needed {i}',
+            'description': 'Construction site work with meals provided. Daily wages paid weekly.',
+            'location': 'Thane, Maharashtra',
+            'skills_required': ['Carpentry', 'Masonry'],
+            'pay_rate': '600',
+            'duration': '3 months',
+            'employer_id': EMPLOYER_ID,
+            'status': 'open',
+            'created_at': '2025-01-01T00:00:00',
+            'applications': [],
+        }
+        workerconnect.message_service.send_message(
+            worker_id, EMPLOYER_ID, f'Hello, I am interested in job {i}. When can I start?')
+
+    workerconnect.jobs[BENCH_JOB_ID] = {
+        'id': BENCH_JOB_ID,
+        'title': 'Bench Job',
+        'description': 'Benchmark job with many applicants',
+        'location': 'Thane, Maharashtra',
+        'skills_required': ['Carpentry'],
+        'pay_rate': '600',
+        'duration': '1 month',
+        'employer_id': EMPLOYER_ID,
+        'status': 'open',
+        'created_at': '2025-01-01T00:00:00',
+        'applications': [
+            {'worker_id': f'bench-w{i}', 'status': 'pending', 'applied_at': '2025-01-02T00:00:00'}
+            for i in range(rows)
+        ],
+    }
+
+
+def measure(client, url, encoding):
+    start = time.perf_counter()
+    response = client.get(url, headers={'Accept-Encoding': encoding}, buffered=False)
+    chunks = iter(response.response)
+    first = next(chunks, b'')
+    ttfb = time.perf_counter() - start
+    size = len(first) + sum(len(chunk) for chunk in chunks)
+    total = time.perf_counter() - start
+    response.close()
+    return size, ttfb, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    populate(args.rows)
+    client = workerconnect.app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = EMPLOYER_ID
+        sess['user_type'] = 'employer'
+
+    routes = {
+        'job_search': '/job/search?search=worker',
+        'applications': f'/job/{BENCH_JOB_ID}/applications',
+        'messages': '/messages',
+    }
+    encodings = ['identity', 'gzip'] + (['br'] if rendering.brotli is not None else [])
+    modes = {'buffered': args.rows + 1, 'streamed': 1}
+
+    print(f'{args.rows} rows, median of {args.repeat} runs')
+    print(f"{'route':<14}{'mode':<10}{'encoding':<10}{'bytes':>10}{'ttfb ms':>10}{'total ms':>10}")
+    for route, url in routes.items():
+        for mode, stream_min_rows in modes.items():
+            workerconnect.app.config['STREAM_MIN_ROWS'] = stream_min_rows
+            for encoding in encodings:
+                runs = [measure(client, url, encoding) for _ in range(args.repeat)]
+                size = runs[-1][0]
+                ttfb = statistics.median(run[1] for run in runs) * 1000
+                total = statistics.median(run[2] for run in runs) * 1000
+                print(f'{route:<14}{mode:<10}{encoding:<10}{size:>10}{ttfb:>10.2f}{total:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+# Thread-safe in-memory data stores
+# Keys are spread across shards, each with its own write lock, so writers to different
+# entities don't contend. Shards are copy-on-write: a write publishes a new shard dict
+# and published dicts are never mutated, so readers take a snapshot by reference
+# without ever waiting for a writer
+
+import threading
+from collections.abc import Mapping, MutableMapping
+from contextlib import contextmanager
+
+
+class StoreSnapshot(Mapping):
+    """Read-only, point-in-time view over a store's published shards"""
+    def __init__(self, shards):
+        self._shards = shards
+
+    def __getitem__(self, key):
+        return self._shards[hash(key) % len(self._shards)][key]
+
+    def __iter__(self):
+        for shard in self._shards:
+            yield from shard
+
+    def __len__(self):
+        return sum(len(shard) for shard in self._shards)
+
+    def __contains__(self, key):
+        return key in self._shards[hash(key) % len(self._shards)]
+
+
+class StripedStore(MutableMapping):
+    """Dict-like store with per-shard write locks and lock-free copy-on-write reads.
+
+    A write copies only its own shard, so with the default 256 shards it costs
+    O(n/256) rather than O(n). Entities are copy-on-write too: update them through
+    update_entity or edit, never in place.
+    """
+    def __init__(self, shards=256):
+        self._locks = [threading.RLock() for _ in range(shards)]
+        self._shards = [{} for _ in range(shards)]  # Published shard dicts are never mutated
+
+    def _index(self, key):
+        return hash(key) % len(self._shards)
+
+    def _publish(self, index, key, value):
+        # Caller must hold the shard lock
+        shard = dict(self._shards[index])
+        shard[key] = value
+        self._shards[index] = shard
+
+    def __getitem__(self, key):
+        return self._shards[self._index(key)][key]
+
+    def __setitem__(self, key, value):
+        index = self._index(key)
+        with self._locks[index]:
+            self._publish(index, key, value)
+
+    def __delitem__(self, key):
+        index = self._index(key)
+        with self._locks[index]:
+            shard = dict(self._shards[index])
+            del shard[key]
+            self._shards[index] = shard
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def __len__(self):
+        return len(self.snapshot())
+
+    def __contains__(self, key):
+        return key in self._shards[self._index(key)]
+
+    def keys(self):
+        return self.snapshot().keys()
+
+    def values(self):
+        return self.snapshot().values()
+
+    def items(self):
+        return self.snapshot().items()
+
+    def snapshot(self):
+        """Return a read-only view of the currently published shards; takes no locks"""
+        return StoreSnapshot(tuple(self._shards))
+
+    def insert_unique(self, key, value):
+        """Insert value at key unless key is already present.
+
+        Returns True if the value was inserted, False if the key already existed.
+        """
+        index = self._index(key)
+        with self._locks[index]:
+            if key in self._shards[index]:
+                return False
+            self._publish(index, key, value)
+            return True
+
+    def update_entity(self, key, fn):
+        """Atomically apply fn to a copy of the entity at key and publish the copy.
+
+        Returns whatever fn returns. Raises KeyError if key is missing.
+        """
+        index = self._index(key)
+        with self._locks[index]:
+            entity = dict(self._shards[index][key])
+            result = fn(entity)
+            self._publish(index, key, entity)
+            return result
+
+    @contextmanager
+    def edit(self, key):
+        """Hold the lock for key and publish a private copy of its entity for in-place edits.
+
+        For code that looks the entity up through the store itself (e.g. a service's
+        update method): it mutates the copy, never an object a reader already holds.
+        """
+        index = self._index(key)
+        with self._locks[index]:
+            entity = dict(self._shards[index][key])
+            self._publish(index, key, entity)
+            yield entity
+
+    def append_unique(self, key, field, item, unique_by):
+        """Append item to entity[field] unless an entry with the same unique_by value exists.
+
+        Returns True if the item was appended, False if it was a duplicate.
+        """
+        def _append(entity):
+            existing = entity.get(field, [])
+            if any(entry.get(unique_by) == item.get(unique_by) for entry in existing):
+                return False
+            entity[field] = existing + [item]
+            return True
+
+        return self.update_entity(key, _append)
@@ -0,0 +1,127 @@
+# Rendering pipeline for large list pages
+# Precompiles templates into a bytecode cache at startup, streams long lists,
+# and negotiates gzip/brotli compression for responses over a size threshold
+
+import os
+import stat
+import zlib
+from flask import current_app, render_template, stream_template, get_flashed_messages, request
+from jinja2 import FileSystemBytecodeCache
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {
+    'text/html', 'text/css', 'text/plain', 'text/javascript',
+    'application/javascript', 'application/json', 'image/svg+xml',
+}
+STREAM_FLUSH_SIZE = 8192  # Bytes of rendered output to gather before flushing a compressed chunk
+
+
+def init_rendering(app):
+    """Configure the bytecode cache, precompile templates and register response compression"""
+    app.config.setdefault('COMPRESS_MIN_SIZE', int(os.environ.get('COMPRESS_MIN_SIZE', 500)))
+    app.config.setdefault('COMPRESS_LEVEL', int(os.environ.get('COMPRESS_LEVEL', 6)))
+    app.config.setdefault('STREAM_MIN_ROWS', int(os.environ.get('STREAM_MIN_ROWS', 100)))
+    app.config.setdefault('JINJA_BYTECODE_CACHE_DIR', os.environ.get('JINJA_BYTECODE_CACHE_DIR'))
+
+    cache_dir = app.config['JINJA_BYTECODE_CACHE_DIR']
+    if cache_dir:
+        _ensure_private_dir(cache_dir)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+    else:
+        # Jinja picks a per-user temp directory and checks its owner and mode itself
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
+    # Compile every template now so the first request doesn't pay for it
+    for name in app.jinja_env.list_templates(extensions=['html']):
+        app.jinja_env.get_template(name)
+
+    @app.after_request
+    def _compress(response):
+        return compress_response(response, app.config)
+
+
+def _ensure_private_dir(path):
+    """Create path as 0700 if needed and refuse it unless only the current user can write to it"""
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if (not stat.S_ISDIR(st.st_mode)
+            or (hasattr(os, 'getuid') and st.st_uid != os.getuid())
+            or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)):
+        raise RuntimeError(f"Bytecode cache directory {path!r} must be owned by the app user "
+                           "and not writable by group or others")
+
+
+def render_list(template_name, row_count, **context):
+    """Render a list page, streaming it when it has at least STREAM_MIN_ROWS rows"""
+    if row_count < current_app.config['STREAM_MIN_ROWS']:
+        return render_template(template_name, **context)
+
+    # Pop flashed messages now; the session is saved before a streamed body is rendered
+    get_flashed_messages()
+    return current_app.response_class(stream_template(template_name, **context), mimetype='text/html')
+
+
+def _negotiate_encoding():
+    """Pick the client's highest-q supported encoding; br wins ties when available"""
+    available = ['br', 'gzip'] if brotli is not None else ['gzip']
+    return request.accept_encodings.best_match(available)
+
+
+def _compressor(encoding, level):
+    """Return (compress, flush, finish) callables for the chosen encoding"""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=min(level, 11))
+        return compressor.process, compressor.flush, compressor.finish
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31 writes a gzip header
+    return (compressor.compress, lambda: compressor.flush(zlib.Z_SYNC_FLUSH),
+            lambda: compressor.flush(zlib.Z_FINISH))
+
+
+def _compress_stream(chunks, encoding, level):
+    compress, flush, finish = _compressor(encoding, level)
+    buffered = 0
+    first = True
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        data = compress(chunk)
+        buffered += len(chunk)
+        # Flush the first chunk right away for time to first byte, then in STREAM_FLUSH_SIZE batches
+        if first or buffered >= STREAM_FLUSH_SIZE:
+            data += flush()
+            buffered = 0
+            first = False
+        if data:
+            yield data
+    yield finish()
+
+
+def compress_response(response, config):
+    if (response.status_code < 200 or response.status_code in (204, 304)
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = _negotiate_encoding()
+    if encoding is None:
+        return response
+
+    level = config['COMPRESS_LEVEL']
+    if response.is_streamed:
+        response.response = _compress_stream(response.response, encoding, level)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < config['COMPRESS_MIN_SIZE']:
+            return response
+        compress, _, finish = _compressor(encoding, level)
+        response.set_data(compress(data) + finish())
+
+    response.headers['Content-Encoding'] = encoding
+    return response
@@ -0,0 +1,39 @@
+import threading
+
+import pytest
+
+JOIN_TIMEOUT = 60
+
+
+@pytest.fixture
+def run_threads():
+    """Run target(i) on count threads and fail if any is still running after the timeout"""
+    def _run(target, count, timeout=JOIN_TIMEOUT):
+        threads = [threading.Thread(target=target, args=(i,), daemon=True) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout)
+        hung = [thread for thread in threads if thread.is_alive()]
+        assert not hung, f"{len(hung)} threads still running after {timeout}s (deadlock?)"
+    return _run
+
+
+@pytest.fixture(scope='session')
+def workerconnect():
+    """The app module; skipped when the services package is not available"""
+    pytest.importorskip('services', reason='app.py needs the services package')
+    import app
+    return app
+
+
+@pytest.fixture
+def logged_in_client(workerconnect):
+    """Factory for a test client whose session is logged in as the given user"""
+    def _client(user_id, user_type):
+        client = workerconnect.app.test_client()
+        with client.session_transaction() as sess:
+            sess['user_id'] = user_id
+            sess['user_type'] = user_type
+        return client
+    return _client
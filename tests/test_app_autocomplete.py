@@ -0,0 +1,78 @@
+def suggest(client, field, q, **params):
+    response = client.get('/api/autocomplete', query_string=dict(field=field, q=q, **params))
+    assert response.status_code == 200
+    return response.get_json()['suggestions']
+
+
+def test_autocomplete_requires_login(workerconnect):
+    response = workerconnect.app.test_client().get('/api/autocomplete?q=pl')
+    assert response.status_code == 401
+
+
+def test_autocomplete_validates_params(logged_in_client):
+    client = logged_in_client('e1', 'employer')
+    assert client.get('/api/autocomplete?field=bogus&q=a').status_code == 400
+    assert client.get('/api/autocomplete?field=skills&q=a&limit=x').status_code == 400
+
+
+def test_autocomplete_serves_catalog_and_sample_data(logged_in_client):
+    client = logged_in_client('e1', 'employer')
+    assert 'Plumbing' in suggest(client, 'skills', 'plu')
+    assert suggest(client, 'locations', 'thane')[0].startswith('Thane')
+    assert 'Seasonal Farm Workers' in suggest(client, 'titles', 'seas')
+    assert suggest(client, 'skills', 'carpnetry') == ['Carpentry']
+    assert suggest(client, 'skills', 'carpnetry', fuzzy='0') == []
+
+
+def test_post_job_updates_titles(logged_in_client):
+    client = logged_in_client('e2', 'employer')
+    client.post('/job/post', data={
+        'title': 'Zephyr Tower Electricians',
+        'description': 'Wiring for a new tower',
+        'location': 'Kochi, Kerala',
+        'skills_required': ['Electrical Work'],
+        'pay_rate': '700',
+        'duration': '2 months',
+    })
+    assert suggest(client, 'titles', 'zeph') == ['Zephyr Tower Electricians']
+    assert 'Kochi' in suggest(client, 'locations', 'koc')
+
+
+def add_worker(workerconnect, worker_id, location):
+    workerconnect.users[worker_id] = {
+        'id': worker_id, 'name': 'Asha', 'email': f'{worker_id}@example.com', 'password': '',
+        'user_type': 'worker', 'location': location, 'skills': [],
+    }
+    workerconnect.autocomplete_index.index_user(workerconnect.users[worker_id])
+
+
+def test_profile_edit_moves_location(workerconnect, logged_in_client):
+    add_worker(workerconnect, 'ac-w1', 'Quilandy, Kerala')
+    client = logged_in_client('ac-w1', 'worker')
+    assert 'Quilandy' in suggest(client, 'locations', 'quil')
+
+    client.post('/profile', data={'name': 'Asha', 'location': 'Vizianagaram, Andhra Pradesh'})
+    assert suggest(client, 'locations', 'quil', fuzzy='0') == []
+    assert 'Vizianagaram' in suggest(client, 'locations', 'vizi')
+
+
+def test_concurrent_profile_saves_keep_weights_consistent(workerconnect, logged_in_client, run_threads):
+    add_worker(workerconnect, 'ac-w2', 'Alleppey, Kerala')
+    add_worker(workerconnect, 'ac-w3', 'Alleppey, Kerala')
+    client = logged_in_client('ac-w2', 'worker')
+
+    def save(_):
+        logged_in_client('ac-w2', 'worker').post(
+            '/profile', data={'name': 'Asha', 'location': 'Tirur, Kerala'})
+
+    run_threads(save, 8)
+    # ac-w3 still lives in Alleppey, so concurrent saves by ac-w2 must not un-index it
+    assert 'Alleppey' in suggest(client, 'locations', 'allep', fuzzy='0')
+    assert 'Tirur' in suggest(client, 'locations', 'tiru', fuzzy='0')
+
+
+def test_profile_with_missing_user_redirects_to_login(logged_in_client):
+    client = logged_in_client('no-such-user', 'worker')
+    response = client.post('/profile', data={'name': 'Ghost'})
+    assert response.status_code == 302
+    assert '/login' in response.headers['Location']
@@ -0,0 +1,40 @@
+THREADS = 8
+REQUESTS_PER_THREAD = 50
+
+
+def add_worker(workerconnect, worker_id):
+    workerconnect.users[worker_id] = {
+        'id': worker_id,
+        'name': f'Worker {worker_id}',
+        'email': f'{worker_id}@example.com',
+        'password': '',
+        'user_type': 'worker',
+        'location': 'Pune, Maharashtra',
+        'skills': [],
+    }
+
+
+def test_concurrent_apply_message_rate_routes(workerconnect, logged_in_client, run_threads):
+    worker_ids = [f'stress-w{i}' for i in range(THREADS)]
+    for worker_id in worker_ids:
+        add_worker(workerconnect, worker_id)
+    messages_before = len(workerconnect.messages)
+    ratings_before = len(workerconnect.ratings)
+
+    def hammer(i):
+        worker_id = worker_ids[i]
+        client = logged_in_client(worker_id, 'worker')
+        for n in range(REQUESTS_PER_THREAD):
+            client.post('/job/j1/apply')
+            client.post('/messages/send', data={'receiver_id': 'e1', 'content': f'hello {n}'})
+            client.post('/rate/e1', data={'rating': '4', 'job_id': 'j1'})
+
+    run_threads(hammer, THREADS)
+
+    applicants = [a['worker_id'] for a in workerconnect.jobs['j1']['applications']]
+    for worker_id in worker_ids:
+        assert applicants.count(worker_id) == 1
+    assert len(workerconnect.messages) - messages_before == THREADS * REQUESTS_PER_THREAD
+    assert len(workerconnect.ratings) - ratings_before == THREADS
+    for worker_id in worker_ids:
+        assert (worker_id, 'e1', 'j1') in workerconnect.rating_claims
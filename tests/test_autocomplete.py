@@ -0,0 +1,152 @@
+import threading
+import time
+
+from autocomplete import AutocompleteIndex, PrefixTrie, location_terms
+
+SKILLS = {
+    's1': {'id': 's1', 'name': 'Carpentry', 'category': 'Construction'},
+    's2': {'id': 's2', 'name': 'Plumbing', 'category': 'Home Services'},
+    's3': {'id': 's3', 'name': 'Painting', 'category': 'Construction'},
+}
+
+
+def test_prefix_results_ranked_by_popularity():
+    trie = PrefixTrie()
+    trie.add('Plumbing')
+    trie.add('Painting', delta=3)
+    trie.add('Packing', delta=2)
+    assert trie.suggest('p') == ['Painting', 'Packing', 'Plumbing']
+    assert trie.suggest('pa') == ['Painting', 'Packing']
+    assert trie.suggest('P', limit=1) == ['Painting']
+
+
+def test_top_k_is_capped_per_node():
+    trie = PrefixTrie(top_k=3)
+    for i, word in enumerate(['alpha', 'alps', 'altar', 'alto', 'album']):
+        trie.add(word, delta=i + 1)
+    assert trie.suggest('al') == ['album', 'alto', 'altar']
+
+
+def test_decrement_reorders_and_removes():
+    trie = PrefixTrie()
+    trie.add('Mumbai', delta=2)
+    trie.add('Mysore')
+    assert trie.suggest('m') == ['Mumbai', 'Mysore']
+    trie.remove('Mumbai', delta=2)
+    assert trie.suggest('m') == ['Mysore']
+    assert trie.suggest('mum', fuzzy=False) == []
+
+
+def test_normalization_merges_case_and_whitespace():
+    trie = PrefixTrie()
+    trie.add('Electronic  City')
+    trie.add('electronic city')
+    assert trie.suggest('ELECTRONIC c') == ['Electronic City']
+
+
+def test_fuzzy_fallback_only_when_prefix_misses():
+    trie = PrefixTrie()
+    for word in ['Painter', 'Plumbing', 'Carpentry']:
+        trie.add(word)
+    assert trie.suggest('plu') == ['Plumbing']
+    assert trie.suggest('carpnetry') == ['Carpentry']
+    assert trie.suggest('plumbnig') == ['Plumbing']
+    assert trie.suggest('carpnetry', fuzzy=False) == []
+    assert trie.suggest('xyz') == []
+
+
+def test_location_terms_split_on_commas():
+    assert location_terms('Thane, Maharashtra') == ['Thane, Maharashtra', 'Thane', 'Maharashtra']
+    assert location_terms('Pune') == ['Pune']
+    assert location_terms(None) == []
+
+
+def test_index_incremental_updates_for_jobs_and_profiles():
+    index = AutocompleteIndex(SKILLS)
+    worker = {'id': 'w1', 'user_type': 'worker', 'location': 'Thane, Maharashtra', 'skills': ['s1']}
+    job = {'title': 'Hotel Cleaners', 'location': 'Banjara Hills, Hyderabad', 'skills_required': ['Cleaning']}
+    index.build({'w1': worker}, {'j1': job})
+
+    assert index.suggest('titles', 'hot') == ['Hotel Cleaners']
+    assert index.suggest('locations', 'ban') == ['Banjara Hills', 'Banjara Hills, Hyderabad']
+    assert index.suggest('skills', 'c') == ['Carpentry', 'Cleaning']
+
+    # post_job: +1 for the new job
+    index.index_job({'title': 'Hotel Cooks', 'location': 'Thane, Maharashtra', 'skills_required': ['Plumbing']})
+    assert index.suggest('titles', 'hotel') == ['Hotel Cleaners', 'Hotel Cooks']
+    assert index.suggest('skills', 'p') == ['Plumbing', 'Painting']
+
+    # profile edit: -1 for the old profile, +1 for the new one
+    updated = dict(worker, location='Pune, Maharashtra', skills=['s3'])
+    index.index_user(worker, delta=-1)
+    index.index_user(updated)
+    assert index.suggest('locations', 'pu') == ['Pune', 'Pune, Maharashtra']
+    assert index.suggest('locations', 'thane') == ['Thane', 'Thane, Maharashtra']  # still used by the job
+    assert index.suggest('skills', 'p') == ['Painting', 'Plumbing']
+    assert index.suggest('skills', 'carp') == ['Carpentry']  # catalog entry remains
+
+
+def test_concurrent_readers_and_writers():
+    trie = PrefixTrie()
+    stop = threading.Event()
+    errors = []
+
+    def writer(seed):
+        i = 0
+        while not stop.is_set():
+            word = f'term{seed}{i % 500}'
+            trie.add(word)
+            if i % 3 == 0:
+                trie.remove(word)
+            i += 1
+
+    def reader(_):
+        try:
+            while not stop.is_set():
+                trie.suggest('term')
+                trie.suggest('tremx')  # forces the fuzzy pass
+        except Exception as exc:  # pragma: no cover - reported via the assertion below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer, args=(i,), daemon=True) for i in range(2)]
+    threads += [threading.Thread(target=reader, args=(i,), daemon=True) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(1)
+    stop.set()
+    for thread in threads:
+        thread.join(10)
+    assert not errors
+
+
+def test_prefix_lookup_is_sub_millisecond():
+    trie = PrefixTrie()
+    for i in range(20000):
+        trie.add(f'job title {i:05d} in city {i % 97}', delta=i % 13 + 1)
+    prefixes = ['j', 'job t', 'job title 1', 'job title 12', 'job title 123']
+    rounds = 2000
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for prefix in prefixes:
+            trie.suggest(prefix)
+    per_lookup = (time.perf_counter() - start) / (rounds * len(prefixes))
+    assert per_lookup < 1e-3, f"{per_lookup * 1e6:.2f}us per prefix lookup"
+
+
+def test_removed_terms_are_pruned():
+    trie = PrefixTrie()
+    trie.add('Mumbai')
+    for i in range(200):
+        trie.add(f'churn location {i}')
+        trie.remove(f'churn location {i}')
+    assert set(trie._root.children) == {'m'}
+    assert all(trie._trigram_index.values())
+    assert trie.suggest('churn') == []
+
+    trie.add('Mumbai Central')
+    trie.remove('Mumbai Central')
+    assert trie.suggest('mum') == ['Mumbai']
+    node = trie._root
+    for char in 'mumbai':
+        node = node.children[char]
+    assert not node.children
@@ -0,0 +1,171 @@
+import threading
+import time
+import uuid
+
+from datastore import StripedStore
+
+THREADS = 16
+OPS_PER_THREAD = 500
+WORKERS = 40
+JOIN_TIMEOUT = 30
+
+
+def test_basic_mapping_operations():
+    store = StripedStore()
+    store['a'] = 1
+    store['b'] = 2
+    assert store['a'] == 1
+    assert 'b' in store
+    assert len(store) == 2
+    assert sorted(store) == ['a', 'b']
+    assert dict(store.snapshot()) == {'a': 1, 'b': 2}
+    del store['a']
+    assert store.get('a') is None
+    assert dict(store.items()) == {'b': 2}
+
+
+def test_insert_unique_keeps_first_value():
+    store = StripedStore()
+    assert store.insert_unique('k', 1)
+    assert not store.insert_unique('k', 2)
+    assert store['k'] == 1
+
+
+def test_update_entity_publishes_a_copy():
+    store = StripedStore()
+    store['u1'] = {'name': 'Old'}
+    before = store['u1']
+    store.update_entity('u1', lambda entity: entity.update(name='New'))
+    assert store['u1'] == {'name': 'New'}
+    assert before == {'name': 'Old'}
+
+
+def test_append_unique_rejects_duplicates():
+    store = StripedStore()
+    store['j1'] = {'applications': []}
+    assert store.append_unique('j1', 'applications', {'worker_id': 'w1'}, unique_by='worker_id')
+    assert not store.append_unique('j1', 'applications', {'worker_id': 'w1'}, unique_by='worker_id')
+    assert len(store['j1']['applications']) == 1
+
+
+def test_concurrent_apply_message_rate_stress(run_threads):
+    jobs = StripedStore()
+    messages = StripedStore()
+    ratings = StripedStore()
+    for j in range(4):
+        jobs[f'j{j}'] = {'id': f'j{j}', 'status': 'open', 'applications': []}
+
+    stop_readers = threading.Event()
+    reader_errors = []
+
+    def writer(i):
+        for op in range(OPS_PER_THREAD):
+            worker_id = f'w{op % WORKERS}'
+            job_id = f'j{i % 4}'
+            jobs.append_unique(job_id, 'applications',
+                               {'worker_id': worker_id, 'status': 'pending'}, unique_by='worker_id')
+            message_id = str(uuid.uuid4())
+            messages[message_id] = {'id': message_id, 'sender_id': worker_id, 'receiver_id': 'e1'}
+            rating_id = f'{worker_id}:e1:{job_id}'
+            ratings.insert_unique(rating_id, {'id': rating_id, 'rater_id': worker_id, 'rating': 5})
+
+    def reader(_):
+        try:
+            while not stop_readers.is_set():
+                for job in jobs.values():
+                    len(job['applications'])
+                len(messages.snapshot())
+        except Exception as exc:  # pragma: no cover - reported via the assertion below
+            reader_errors.append(exc)
+
+    readers = [threading.Thread(target=reader, args=(i,), daemon=True) for i in range(4)]
+    for thread in readers:
+        thread.start()
+
+    start = time.perf_counter()
+    run_threads(writer, THREADS)
+    elapsed = time.perf_counter() - start
+
+    stop_readers.set()
+    for thread in readers:
+        thread.join(JOIN_TIMEOUT)
+
+    assert not reader_errors
+    # Each job holds exactly one application per worker that applied to it
+    for job in jobs.values():
+        worker_ids = [application['worker_id'] for application in job['applications']]
+        assert len(worker_ids) == len(set(worker_ids)) == WORKERS
+    assert len(messages) == THREADS * OPS_PER_THREAD
+    assert len(ratings) == WORKERS * 4
+
+    ops_per_second = THREADS * OPS_PER_THREAD * 3 / elapsed
+    assert ops_per_second > 5000, f"only {ops_per_second:,.0f} writes/s across {THREADS} threads"
+
+
+def test_message_writes_stay_cheap_in_a_large_store():
+    messages = StripedStore()
+    for _ in range(100000):
+        message_id = str(uuid.uuid4())
+        messages[message_id] = {'id': message_id}
+
+    writes = 1000
+    start = time.perf_counter()
+    for _ in range(writes):
+        message_id = str(uuid.uuid4())
+        messages[message_id] = {'id': message_id}
+    per_write = (time.perf_counter() - start) / writes
+    assert per_write < 1e-3, f"{per_write * 1e6:.0f}us per write with 100k messages"
+
+
+def test_readers_do_not_wait_for_a_writer_holding_the_lock():
+    store = StripedStore()
+    store['j1'] = {'applications': []}
+    store['j2'] = {'applications': []}
+    writer_inside = threading.Event()
+    release_writer = threading.Event()
+
+    def slow_update(entity):
+        writer_inside.set()
+        release_writer.wait(JOIN_TIMEOUT)
+        entity['applications'] = ['late']
+
+    writer = threading.Thread(target=store.update_entity, args=('j1', slow_update), daemon=True)
+    writer.start()
+    assert writer_inside.wait(JOIN_TIMEOUT)
+    try:
+        read_done = threading.Event()
+        seen = {}
+
+        def reader():
+            seen.update(store.items())
+            seen['j1_direct'] = store['j1']
+            read_done.set()
+
+        threading.Thread(target=reader, daemon=True).start()
+        assert read_done.wait(1), 'reader blocked behind a writer holding the shard lock'
+        assert seen['j1'] == {'applications': []}
+        assert seen['j1_direct'] == {'applications': []}
+    finally:
+        release_writer.set()
+        writer.join(JOIN_TIMEOUT)
+    assert store['j1'] == {'applications': ['late']}
+
+
+def test_snapshot_is_unaffected_by_later_writes():
+    store = StripedStore()
+    store['a'] = 1
+    snapshot = store.snapshot()
+    store['b'] = 2
+    del store['a']
+    assert dict(snapshot) == {'a': 1}
+    assert dict(store.snapshot()) == {'b': 2}
+
+
+def test_edit_publishes_a_private_copy():
+    store = StripedStore()
+    store['u1'] = {'name': 'Old'}
+    before = store['u1']
+    with store.edit('u1'):
+        store['u1']['name'] = 'New'  # what a service mutating the looked-up entity does
+    assert store['u1'] == {'name': 'New'}
+    assert before == {'name': 'Old'}
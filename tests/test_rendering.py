@@ -0,0 +1,142 @@
+import gzip
+import os
+import zlib
+
+import pytest
+from flask import Flask, Response, flash
+from jinja2 import DictLoader
+
+import rendering
+from rendering import init_rendering, render_list
+
+LIST_TEMPLATE = (
+    '{% for message in get_flashed_messages() %}<p class="flash">{{ message }}</p>{% endfor %}'
+    '<table>{% for row in rows %}<tr><td>Row {{ row }}</td><td>Mumbai, Maharashtra</td></tr>{% endfor %}</table>'
+)
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    app.jinja_loader = DictLoader({'list.html': LIST_TEMPLATE})
+    app.config['JINJA_BYTECODE_CACHE_DIR'] = str(tmp_path / 'jinja-cache')
+    app.config['STREAM_MIN_ROWS'] = 100
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    init_rendering(app)
+
+    @app.route('/list/<int:count>')
+    def list_page(count):
+        return render_list('list.html', count, rows=range(count))
+
+    @app.route('/flash/<int:count>')
+    def flash_then_list(count):
+        flash('Saved')
+        return render_list('list.html', count, rows=range(count))
+
+    @app.route('/image')
+    def image():
+        return Response(b'\x89PNG' * 1000, mimetype='image/png')
+
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def test_templates_precompiled_into_bytecode_cache(app):
+    assert os.listdir(app.config['JINJA_BYTECODE_CACHE_DIR'])
+
+
+def test_rejects_cache_dir_writable_by_others(tmp_path):
+    shared = tmp_path / 'shared'
+    shared.mkdir()
+    shared.chmod(0o777)
+    app = Flask(__name__)
+    app.config['JINJA_BYTECODE_CACHE_DIR'] = str(shared)
+    with pytest.raises(RuntimeError):
+        init_rendering(app)
+
+
+def test_default_cache_dir_is_jinjas_per_user_dir():
+    app = Flask(__name__)
+    app.config['JINJA_BYTECODE_CACHE_DIR'] = None
+    init_rendering(app)
+    assert app.jinja_env.bytecode_cache.directory.endswith(f'_jinja2-cache-{os.getuid()}')
+
+
+def test_small_response_not_compressed(client):
+    response = client.get('/list/2', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in response.headers
+    assert 'Accept-Encoding' in response.headers['Vary']
+
+
+def test_large_buffered_response_gzipped(client, monkeypatch):
+    monkeypatch.setattr(rendering, 'brotli', None)
+    response = client.get('/list/50', headers={'Accept-Encoding': 'gzip, br'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert int(response.headers['Content-Length']) == len(response.data)
+    assert gzip.decompress(response.data).count(b'<tr>') == 50
+
+
+def test_identity_when_client_does_not_accept_compression(client):
+    response = client.get('/list/50', headers={'Accept-Encoding': 'identity'})
+    assert 'Content-Encoding' not in response.headers
+    assert response.data.count(b'<tr>') == 50
+
+
+def test_non_text_response_left_alone(client):
+    response = client.get('/image', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in response.headers
+    assert 'Vary' not in response.headers
+
+
+def test_long_list_streamed_and_gzipped(client, monkeypatch):
+    monkeypatch.setattr(rendering, 'brotli', None)
+    response = client.get('/list/1000', headers={'Accept-Encoding': 'gzip'}, buffered=False)
+    assert 'Content-Length' not in response.headers
+    assert response.headers['Content-Encoding'] == 'gzip'
+    chunks = list(response.response)
+    assert len(chunks) > 2
+    body = zlib.decompress(b''.join(chunks), 31)
+    assert body.count(b'<tr>') == 1000
+    # The first flushed chunk decodes on its own, so the client can start rendering early
+    assert zlib.decompressobj(31).decompress(chunks[0]).startswith(b'<table>')
+
+
+def test_brotli_preferred_when_available(client):
+    brotli = pytest.importorskip('brotli')
+    response = client.get('/list/1000', headers={'Accept-Encoding': 'gzip, br'}, buffered=False)
+    assert response.headers['Content-Encoding'] == 'br'
+    assert brotli.decompress(b''.join(response.response)).count(b'<tr>') == 1000
+
+
+def test_client_preference_beats_brotli(client):
+    pytest.importorskip('brotli')
+    response = client.get('/list/50', headers={'Accept-Encoding': 'gzip;q=1, br;q=0.1'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    response = client.get('/list/50', headers={'Accept-Encoding': 'br;q=0, gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+
+
+def test_wildcard_accept_encoding(client, monkeypatch):
+    monkeypatch.setattr(rendering, 'brotli', None)
+    response = client.get('/list/50', headers={'Accept-Encoding': '*'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+
+
+def test_compression_shrinks_thousand_row_page(client, monkeypatch):
+    monkeypatch.setattr(rendering, 'brotli', None)
+    plain = client.get('/list/1000', headers={'Accept-Encoding': 'identity'}).data
+    compressed = client.get('/list/1000', headers={'Accept-Encoding': 'gzip'}).data
+    assert len(compressed) * 5 < len(plain)
+
+
+def test_flashes_consumed_before_streaming(client):
+    first = client.get('/flash/200')
+    assert first.data.count(b'class="flash"') == 1
+    second = client.get('/list/200')
+    assert b'class="flash"' not in second.data